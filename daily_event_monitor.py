@@ -1,17 +1,128 @@
+import collections
 import copy
 import datetime
+import functools
 import json
 import os
 import pathlib
+import sys
 import typing
 
 import requests
 import pytz
 
+try:
+    import orjson
+except ImportError:  # fall back to the standard library encoder
+    orjson = None
+
 TIMEZONE = pytz.timezone("US/Eastern")
 
 DailyEventValueType = str
 
+# Each day's events are stored column-wise, as parallel lists of timestamps
+# ("t") and values ("v"), rather than as a list of (timestamp, value) pairs
+DailyEventsType = typing.Dict[str, typing.List]
+
+# Once the history spans more than this many days, saving appends new events
+# to a JSON Lines journal next to the data file instead of rewriting it ...
+JOURNAL_MIN_DAYS = 100
+
+# ... until the journal holds this many events, at which point it is compacted
+# back into the data file (about a month of daily scrapes)
+JOURNAL_MAX_EVENTS = 31
+
+
+def _json_dumps(data: typing.Any, pretty: bool = True) -> bytes:
+    """
+    Serializes data as JSON, using orjson when it is available.
+
+    :param data: The JSON-compatible data to serialize.
+    :param pretty: Whether to indent the output, rather than write it on a single line.
+    :return: The UTF-8 encoded JSON document.
+    :rtype: bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else None)
+    # mirror orjson's output byte for byte (raw UTF-8, same separators), so the
+    # committed data files do not change when orjson is (un)available
+    if pretty:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _json_loads(buf: bytes) -> typing.Any:
+    """
+    Parses a JSON document, using orjson when it is available.
+
+    :param buf: The UTF-8 encoded JSON document.
+    :return: The parsed data.
+    """
+    if orjson is not None:
+        return orjson.loads(buf)
+    return json.loads(buf)
+
+
+def _read_file(filename: str) -> bytes:
+    """
+    Reads a whole file with a single read() on a raw descriptor.
+
+    :param filename: The name of the file to read.
+    :return: The contents of the file.
+    :rtype: bytes
+    """
+    fd = os.open(filename, os.O_RDONLY)
+    try:
+        return os.read(fd, os.fstat(fd).st_size)
+    finally:
+        os.close(fd)
+
+
+def _write_file(filename: str, payload: bytes, append: bool = False) -> None:
+    """
+    Writes a buffer to a file, normally with a single write(), and flushes it to disk.
+
+    :param filename: The name of the file to write.
+    :param payload: The bytes to write.
+    :param append: Whether to append to the file, rather than truncate it.
+    """
+    flags = os.O_WRONLY | os.O_CREAT | (os.O_APPEND if append else os.O_TRUNC)
+    fd = os.open(filename, flags, 0o644)
+    try:
+        # write() may be partial for large buffers; resume through a memoryview
+        # so the remainder is never copied
+        view = memoryview(payload)
+        while len(view) > 0:
+            view = view[os.write(fd, view) :]
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def journal_path(filename: str) -> str:
+    """
+    Gets the path of the journal that accompanies a data file, e.g. "data.jsonl" for "data.json".
+
+    :param filename: The name of the data file.
+    :return: The name of the journal file.
+    :rtype: str
+    """
+    return os.path.splitext(filename)[0] + ".jsonl"
+
+
+def _format_time(now: datetime.datetime) -> str:
+    """
+    Formats a datetime as "YYYY-MM-DD HH:MMAM/PM", like strftime("%Y-%m-%d %I:%M%p") in the C locale.
+
+    :param now: The datetime to format.
+    :return: The formatted time.
+    :rtype: str
+    """
+    return (
+        f"{now.year:04d}-{now.month:02d}-{now.day:02d} "
+        f"{(now.hour - 1) % 12 + 1:02d}:{now.minute:02d}{'AM' if now.hour < 12 else 'PM'}"
+    )
+
 
 def time_now() -> str:
     """
@@ -20,7 +131,7 @@ def time_now() -> str:
     :return: A string representing the current time formatted as specified.
     :rtype: str
     """
-    return datetime.datetime.now(TIMEZONE).strftime("%Y-%m-%d %I:%M%p")
+    return _format_time(datetime.datetime.now(TIMEZONE))
 
 
 def today() -> typing.Tuple[int, int, int]:
@@ -34,6 +145,61 @@ def today() -> typing.Tuple[int, int, int]:
     return (now.year, now.month, now.day)
 
 
+def _now_parts() -> typing.Tuple[
+    datetime.datetime, typing.Tuple[int, int, int], str
+]:
+    """
+    Gets the current time in the "US/Eastern" timezone once, in all the forms the monitor needs.
+
+    :return: A tuple of the current datetime, the (year, month, day) date and the formatted time.
+    :rtype: typing.Tuple[datetime.datetime, typing.Tuple[int, int, int], str]
+    """
+    now = datetime.datetime.now(TIMEZONE)
+    return (now, (now.year, now.month, now.day), _format_time(now))
+
+
+def _intern(value: DailyEventValueType) -> DailyEventValueType:
+    """
+    Interns string event values, so repeated values share a single object.
+
+    String subclasses (e.g. BeautifulSoup's NavigableString) cannot be interned,
+    so they are first converted to an exact str.
+
+    :param value: The event value.
+    :return: The interned value as an exact str, or the value itself if it is not a string.
+    """
+    if isinstance(value, str):
+        return sys.intern(str.__str__(value))
+    return value
+
+
+def _empty_day() -> DailyEventsType:
+    """
+    Creates the columnar record of a day without events.
+
+    :return: A new dictionary with empty "t" (timestamps) and "v" (values) lists.
+    :rtype: DailyEventsType
+    """
+    return {"t": [], "v": []}
+
+
+def _columnar_day(events: typing.Any) -> DailyEventsType:
+    """
+    Builds a fresh columnar record of a day's events.
+
+    Accepts either the columnar layout or the legacy list of (timestamp, value)
+    pairs used by earlier versions of the data files.
+
+    :param events: The events of a single day, in either layout.
+    :return: A new dictionary with the "t" (timestamps) and "v" (values) lists.
+    :rtype: DailyEventsType
+    """
+    if isinstance(events, dict):
+        return {"t": list(events["t"]), "v": list(events["v"])}
+    return {"t": [event[0] for event in events], "v": [event[1] for event in events]}
+
+
+@functools.lru_cache(maxsize=8192)
 def prev_day(
     year: int, month: int, day: int
 ) -> typing.Optional[typing.Tuple[int, int, int]]:
@@ -50,14 +216,15 @@ def prev_day(
     :rtype: typing.Optional[typing.Tuple[int, int, int]]
     """
     try:
-        date = datetime.datetime(year=year, month=month, day=day)
+        date = datetime.date(year=year, month=month, day=day)
     except ValueError:
         return None
 
-    date += datetime.timedelta(hours=-24)
+    date += datetime.timedelta(days=-1)
     return (date.year, date.month, date.day)
 
 
+@functools.lru_cache(maxsize=8192)
 def next_day(
     year: int, month: int, day: int
 ) -> typing.Optional[typing.Tuple[int, int, int]]:
@@ -74,11 +241,11 @@ def next_day(
     :rtype: typing.Optional[typing.Tuple[int, int, int]]
     """
     try:
-        date = datetime.datetime(year=year, month=month, day=day)
+        date = datetime.date(year=year, month=month, day=day)
     except ValueError:
         return None
 
-    date += datetime.timedelta(hours=24)
+    date += datetime.timedelta(days=1)
     return (date.year, date.month, date.day)
 
 
@@ -87,8 +254,12 @@ class DailyEventMonitor:
     A class to monitor and record daily events.
 
     Attributes:
-        _data (dict): A dictionary to store event data.
+        _data (dict): A dictionary mapping each day to its columnar event data.
         _filename (str, optional): The filename where event data is saved and loaded from.
+        _synced_filename (str, optional): The data file that, with its journal, holds all events but the pending ones,
+            and whose journal can be safely appended to.
+        _journal_size (int): The number of records in the journal of the synced data file.
+        _pending (list): The (day, timestamp, value) events added since the last load or save.
     """
 
     def __init__(
@@ -100,32 +271,63 @@ class DailyEventMonitor:
         :param filename: The name of the file from which to load initial event data.
         :param data: Initial event data to be used by the monitor.
         """
-        self._data = dict()
+        self._data = collections.defaultdict(_empty_day)
         self._filename = None
+        self._synced_filename = None
+        self._journal_size = 0
+        self._pending = []
 
         if data is not None:
-            self._data = copy.deepcopy(data)
+            self._data = collections.defaultdict(
+                _empty_day,
+                {key: _columnar_day(events) for key, events in data.items()},
+            )
+            self._intern_values()
 
         if filename is not None:
             self.load(filename)
 
-    def _lookup_day(
-        self, year: int, month: int, day: int
-    ) -> typing.List[typing.Tuple[typing.Tuple[str, DailyEventValueType]]]:
+    def __deepcopy__(self, memo: dict) -> "DailyEventMonitor":
+        """
+        Creates a deep copy of the monitor, copying the event data without the generic deepcopy machinery.
+
+        :param memo: The memo dictionary used by copy.deepcopy.
+        :return: An independent copy of this monitor.
+        """
+        new = self.__class__.__new__(self.__class__)
+        memo[id(self)] = new
+        for name, value in self.__dict__.items():
+            if name == "_data":
+                new._data = collections.defaultdict(_empty_day, self.data)
+            else:
+                setattr(new, name, copy.deepcopy(value, memo))
+        return new
+
+    def _intern_values(self) -> None:
+        """
+        Interns all stored event values, so identical values across days share storage.
+        """
+        for events in self._data.values():
+            events["v"] = [_intern(value) for value in events["v"]]
+
+    def _event_count(self) -> int:
+        """
+        Counts the events recorded over all days.
+
+        :return: The total number of events.
+        """
+        return sum(len(events["v"]) for events in self._data.values())
+
+    def _lookup_day(self, year: int, month: int, day: int) -> DailyEventsType:
         """
         Looks up events for a specific day.
 
         :param year: The year of the date to look up.
         :param month: The month of the date to look up.
         :param day: The day of the date to look up.
-        :return: A list of events for the specified day.
+        :return: The columnar event data for the specified day.
         """
-        if self._data is None:
-            self._data = dict()
-
-        key = "{}-{}-{}".format(year, month, day)
-        self._data[key] = self._data.get(key, list())
-        return self._data[key]
+        return self._data[f"{year}-{month}-{day}"]
 
     def get(
         self, year: int, month: int, day: int
@@ -136,9 +338,11 @@ class DailyEventMonitor:
         :param year: The year of the date for which to retrieve events.
         :param month: The month of the date for which to retrieve events.
         :param day: The day of the date for which to retrieve events.
-        :return: A list of events for the specified day.
+        :return: A list of (timestamp, value) events for the specified day.
         """
-        return self._lookup_day(year=year, month=month, day=day)
+        # only adding an event creates its day, so days are never saved empty
+        events = self._data.get(f"{year}-{month}-{day}", _empty_day())
+        return list(zip(events["t"], events["v"]))
 
     def add(
         self,
@@ -158,14 +362,14 @@ class DailyEventMonitor:
         :param ignore_repeat: Whether to ignore the event if it is a repeat of the last event for that day.
         :return: True if the event was added, False otherwise (e.g., if ignored due to being a repeat).
         """
-        data = self._lookup_day(year=year, month=month, day=day)
-
-        if ignore_repeat and len(data) > 0 and data[-1][1] == value:
-            return False
-
-        # add data point
-        data.append((time_now(), value))
-        return True
+        return self._add(
+            year=year,
+            month=month,
+            day=day,
+            value=value,
+            stamp=time_now(),
+            ignore_repeat=ignore_repeat,
+        )
 
     def add_today(self, value: DailyEventValueType, ignore_repeat: bool = True) -> bool:
         """
@@ -175,15 +379,55 @@ class DailyEventMonitor:
         :param ignore_repeat: Whether to ignore the event if it is a repeat of the last event for that day.
         :return: True if the event was added, False otherwise (e.g., if ignored due to being a repeat).
         """
-        (year_now, month_now, day_now) = today()
-        return self.add(
+        # read the clock once, so the date and timestamp always agree
+        (_, (year_now, month_now, day_now), stamp) = _now_parts()
+        return self._add(
             year=year_now,
             month=month_now,
             day=day_now,
             value=value,
+            stamp=stamp,
             ignore_repeat=ignore_repeat,
         )
 
+    def _add(
+        self,
+        year: int,
+        month: int,
+        day: int,
+        value: DailyEventValueType,
+        stamp: str,
+        ignore_repeat: bool = True,
+    ) -> bool:
+        """
+        Adds an event with a given timestamp for a specific day.
+
+        :param year: The year of the date to which to add an event.
+        :param month: The month of the date to which to add an event.
+        :param day: The day of the date to which to add an event.
+        :param value: The value or identifier of the event to add.
+        :param stamp: The formatted time at which the event was recorded.
+        :param ignore_repeat: Whether to ignore the event if it is a repeat of the last event for that day.
+        :return: True if the event was added, False otherwise (e.g., if ignored due to being a repeat).
+        """
+        value = _intern(value)
+        events = self._lookup_day(year=year, month=month, day=day)
+        values = events["v"]
+
+        if ignore_repeat and len(values) > 0:
+            last = values[-1]
+            # _intern turns every stored and incoming string into an interned,
+            # exact str, so equal strings are the same object; only non-string
+            # values need a full comparison
+            if last is value or (type(value) is not str and last == value):
+                return False
+
+        # add data point
+        events["t"].append(stamp)
+        values.append(value)
+        self._pending.append((f"{year}-{month}-{day}", stamp, value))
+        return True
+
     def load(self, filename: typing.Optional[str] = None) -> bool:
         """
         Loads event data from a file.
@@ -196,34 +440,141 @@ class DailyEventMonitor:
             raise ValueError("no filename available!")
 
         self._filename = filename
+        self._synced_filename = None
+        self._journal_size = 0
+        self._pending = []
 
         try:
-            with open(filename) as f:
-                try:
-                    data = json.loads(f.read())
-                    self._data = data
-                    return True
-                except:
-                    return False
-        except:
+            data = _json_loads(_read_file(filename))
+            # migrates files written with the legacy list-of-pairs layout
+            self._data = collections.defaultdict(
+                _empty_day,
+                {key: _columnar_day(events) for key, events in data.items()},
+            )
+        except (OSError, ValueError, TypeError, AttributeError, KeyError, IndexError):
+            # missing, unreadable or malformed file
             return False
 
-    def save(self, filename: typing.Optional[str] = None) -> None:
+        (self._journal_size, clean) = self._replay_journal(journal_path(filename))
+        self._intern_values()
+
+        # never append after a journal tail that could not be parsed: leave the
+        # instance unsynced, so the next save writes a full snapshot instead
+        if clean:
+            self._synced_filename = filename
+        return True
+
+    def _replay_journal(self, journal_filename: str) -> typing.Tuple[int, bool]:
+        """
+        Applies the events recorded in a journal file on top of the loaded event data.
+
+        Each record carries the sequence number "n" of its event over the whole
+        history, so records the data file already holds (left behind if a run
+        was interrupted while compacting the journal) are skipped.
+
+        :param journal_filename: The name of the journal file.
+        :return: The number of records in the journal, and whether it was entirely well-formed.
+        """
+        try:
+            buf = _read_file(journal_filename)
+        except FileNotFoundError:
+            return (0, True)
+        except OSError:
+            # unreadable journal: its events are lost to this load, and it must
+            # not be appended to
+            return (0, False)
+
+        # a complete journal always ends with a newline, otherwise the last
+        # append was torn by an interrupted run
+        clean = len(buf) == 0 or buf.endswith(b"\n")
+        count = self._event_count()
+        lines = buf.splitlines()
+
+        for line in lines:
+            try:
+                record = _json_loads(line)
+                (key, stamp, value, n) = (
+                    record["date"],
+                    record["t"],
+                    record["v"],
+                    int(record["n"]),
+                )
+            except (ValueError, TypeError, KeyError):
+                clean = False
+                continue
+
+            if n <= count:
+                continue
+
+            events = self._data[key]
+            events["t"].append(stamp)
+            events["v"].append(value)
+            count += 1
+
+        return (len(lines), clean)
+
+    def save(self, filename: typing.Optional[str] = None, pretty: bool = False) -> None:
         """
         Saves the current event data to a file.
 
+        Once the history is long, new events are appended to the file's journal
+        (see journal_path) rather than rewriting the whole file, and the journal
+        is compacted back into the file every JOURNAL_MAX_EVENTS events.
+
         :param filename: The name of the file to which to save event data. Uses the instance's filename if None.
+        :param pretty: Whether to indent the data file for readability, rather than write compact JSON. Journal
+            records are always compact, so this forces a full rewrite of the data file.
         """
         filename = filename or self._filename
         if filename is None:
             raise ValueError("no filename available!")
 
-        # ensure the folder where we output the file exists
-        pathlib.Path(os.path.dirname(filename)).mkdir(parents=True, exist_ok=True)
+        journal_filename = journal_path(filename)
+
+        if (
+            not pretty
+            and filename == self._synced_filename
+            and len(self._data) > JOURNAL_MIN_DAYS
+            and self._journal_size + len(self._pending) <= JOURNAL_MAX_EVENTS
+        ):
+            if len(self._pending) > 0:
+                # one append with all new events, one JSON record per line,
+                # numbered by their position in the whole history
+                first = self._event_count() - len(self._pending) + 1
+                payload = b"".join(
+                    _json_dumps(
+                        {"date": key, "t": stamp, "v": value, "n": n}, pretty=False
+                    )
+                    + b"\n"
+                    for (n, (key, stamp, value)) in enumerate(self._pending, first)
+                )
+                _write_file(journal_filename, payload, append=True)
+                self._journal_size += len(self._pending)
+        else:
+            # ensure the folder where we output the file exists
+            pathlib.Path(os.path.dirname(filename)).mkdir(parents=True, exist_ok=True)
+
+            # serialize up front, then write it in one go to a temporary file
+            # that atomically replaces the target, so an interrupted run cannot
+            # leave a truncated data file behind
+            tmp_filename = filename + ".tmp"
+            _write_file(tmp_filename, _json_dumps(self._data, pretty=pretty))
+            os.replace(tmp_filename, filename)
+
+            # the data file now holds every event, so empty the journal; it is
+            # truncated rather than removed, so git scrapes record the change;
+            # if that fails, its records are all skipped on load anyway, since
+            # the data file already holds their sequence numbers
+            if os.path.exists(journal_filename):
+                try:
+                    _write_file(journal_filename, b"")
+                except OSError:
+                    pass
+            self._journal_size = 0
 
-        with open(filename, "w") as f:
-            f.write(json.dumps(self._data, indent=2))
-            self._filename = filename
+        self._pending = []
+        self._filename = filename
+        self._synced_filename = filename
 
     @property
     def file_path(self) -> typing.Optional[str]:
@@ -237,8 +588,11 @@ class DailyEventMonitor:
     @property
     def data(self) -> dict:
         """
-        Returns a deep copy of the event data.
+        Returns a copy of the event data.
+
+        Timestamps and values are atomic, so copying each day's columns is
+        enough to isolate the copy from the monitor's own state.
 
-        :return: A copy of the event data.
+        :return: A copy of the event data, mapping each day to its "t" and "v" lists.
         """
-        return copy.deepcopy(self._data)
+        return {key: _columnar_day(events) for key, events in self._data.items()}
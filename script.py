@@ -3,7 +3,9 @@ Scrapes a headline from The Daily Pennsylvanian website and saves it to a
 JSON file that tracks headlines over time.
 """
 
+import html
 import os
+import re
 import sys
 
 import daily_event_monitor
@@ -12,6 +14,97 @@ import bs4
 import requests
 import loguru
 
+# Matches anchor opening tags, scanning quoted attribute values as a whole so a
+# `>` inside them does not end the tag, and the attributes within a tag
+_ANCHOR_TAG_RE = re.compile(
+    rb"""<a((?:\s(?:[^>"']|"[^"]*"|'[^']*')*)?)>""", re.IGNORECASE
+)
+_ATTRIBUTE_RE = re.compile(
+    rb"""([^\s/>][^\s/=>]*)(?:\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]*)))?"""
+)
+
+# Matches the text of an anchor body without nested markup
+_HEADLINE_BODY_RE = re.compile(rb"([^<]*)</a\s*>", re.IGNORECASE)
+
+# Shared session, so repeated requests reuse the same keep-alive connection
+# instead of paying for a new TCP + TLS handshake each time
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://", requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=4)
+)
+
+
+def _class_tokens(attributes):
+    """
+    Gets the classes of an HTML tag from its raw attributes, keeping the first
+    class attribute if it is repeated, as lxml does.
+
+    Args:
+        attributes (bytes): The raw attributes of the tag.
+
+    Returns:
+        list: The class names of the tag.
+    """
+    for attribute in _ATTRIBUTE_RE.finditer(attributes):
+        if attribute.group(1).lower() == b"class":
+            value = b"".join(part or b"" for part in attribute.group(2, 3, 4))
+            return html.unescape(value.decode("utf-8", "replace")).split()
+    return []
+
+
+def _in_raw_section(content, position):
+    """
+    Checks whether a position of an HTML document is inside a comment or the
+    body of a `<script>` or `<style>` element, where tags are not parsed.
+
+    Args:
+        content (bytes): The raw HTML document.
+        position (int): The offset within the document.
+
+    Returns:
+        bool: True if the position is inside such a section.
+    """
+    preceding = content[:position].lower()
+    if preceding.rfind(b"<!--") > preceding.rfind(b"-->"):
+        return True
+    return any(
+        preceding.rfind(b"<" + name) > preceding.rfind(b"</" + name)
+        for name in (b"script", b"style")
+    )
+
+
+def extract_headline(content):
+    """
+    Extracts the main headline from the HTML of The Daily Pennsylvanian home page.
+
+    Args:
+        content (bytes): The raw HTML of the home page.
+
+    Returns:
+        str: The headline text if found, otherwise an empty string.
+    """
+    # fast path: find the first anchor with the frontpage-link class and read
+    # its body directly, as long as it is plain text in regular markup
+    for tag in _ANCHOR_TAG_RE.finditer(content):
+        attributes = tag.group(1)
+        if b"frontpage-link" not in attributes:
+            continue
+        if "frontpage-link" not in _class_tokens(attributes):
+            continue
+
+        self_closing = attributes.rstrip().endswith(b"/")
+        if not self_closing and not _in_raw_section(content, tag.start()):
+            body = _HEADLINE_BODY_RE.match(content, tag.end())
+            if body is not None:
+                return html.unescape(body.group(1).decode("utf-8", "replace"))
+        break
+
+    # the anchor has nested markup, sits in unusual markup, or was not found:
+    # fall back to a real parser, backed by lxml's C HTML parser
+    soup = bs4.BeautifulSoup(content, "lxml")
+    target_element = soup.find("a", class_="frontpage-link")
+    return "" if target_element is None else target_element.text
+
 
 def scrape_data_point():
     """
@@ -20,14 +113,12 @@ def scrape_data_point():
     Returns:
         str: The headline text if found, otherwise an empty string.
     """
-    req = requests.get("https://www.thedp.com")
+    req = _SESSION.get("https://www.thedp.com")
     loguru.logger.info(f"Request URL: {req.url}")
     loguru.logger.info(f"Request status code: {req.status_code}")
 
     if req.ok:
-        soup = bs4.BeautifulSoup(req.text, "html.parser")
-        target_element = soup.find("a", class_="frontpage-link")
-        data_point = "" if target_element is None else target_element.text
+        data_point = extract_headline(req.content)
         loguru.logger.info(f"Data point: {data_point}")
         return data_point
 
@@ -82,6 +173,13 @@ if __name__ == "__main__":
     with open(dem.file_path, "r") as f:
         loguru.logger.info(f.read())
 
+    # recent events may only be in the journal, until it is compacted
+    journal_path = daily_event_monitor.journal_path(dem.file_path)
+    if os.path.exists(journal_path):
+        loguru.logger.info("Printing contents of journal file {}".format(journal_path))
+        with open(journal_path, "r") as f:
+            loguru.logger.info(f.read())
+
     # Finish
     loguru.logger.info("Scrape complete")
     loguru.logger.info("Exiting")
@@ -0,0 +1,268 @@
+import copy
+import datetime
+import json
+import os
+
+import pytest
+
+import daily_event_monitor
+
+
+def test_json_dumps_is_independent_of_orjson(monkeypatch):
+    data = {"2024-1-1": {"t": ["2024-01-01 09:00AM"], "v": ['Café "Penn" 😀']}}
+
+    with_orjson = {
+        pretty: daily_event_monitor._json_dumps(data, pretty=pretty)
+        for pretty in (True, False)
+    }
+    monkeypatch.setattr(daily_event_monitor, "orjson", None)
+
+    for pretty in (True, False):
+        assert (
+            daily_event_monitor._json_dumps(data, pretty=pretty) == with_orjson[pretty]
+        )
+
+
+def test_add_accepts_str_subclasses():
+    class Headline(str):
+        pass
+
+    dem = daily_event_monitor.DailyEventMonitor()
+
+    assert dem.add(2024, 1, 1, Headline("Penn wins"))
+    assert type(dem.get(2024, 1, 1)[0][1]) is str
+
+
+def test_add_ignores_repeats_across_string_types():
+    class Headline(str):
+        pass
+
+    dem = daily_event_monitor.DailyEventMonitor(
+        data={"2024-1-1": [("2024-01-01 09:00AM", Headline("Penn " + "wins"))]}
+    )
+
+    assert not dem.add(2024, 1, 1, "".join(["Penn ", "wins"]))
+    assert not dem.add(2024, 1, 1, Headline("Penn wins"))
+    assert dem.add(2024, 1, 1, 7)
+    assert not dem.add(2024, 1, 1, 7)
+
+
+@pytest.fixture
+def journaled(monkeypatch, tmp_path):
+    """
+    Returns the path of a data file with one day of history, for which saves
+    are journaled until the journal holds three events.
+    """
+    monkeypatch.setattr(daily_event_monitor, "JOURNAL_MIN_DAYS", 0)
+    monkeypatch.setattr(daily_event_monitor, "JOURNAL_MAX_EVENTS", 3)
+
+    filename = str(tmp_path / "data" / "headlines.json")
+    dem = daily_event_monitor.DailyEventMonitor(filename)
+    dem.add(2030, 1, 1, "first")
+    dem.save()
+    return filename
+
+
+def add_and_save(filename, day, value):
+    dem = daily_event_monitor.DailyEventMonitor(filename)
+    assert dem.add(2030, 1, day, value)
+    dem.save()
+
+
+def values(filename):
+    dem = daily_event_monitor.DailyEventMonitor(filename)
+    return [value for events in dem.data.values() for value in events["v"]]
+
+
+def test_save_appends_to_journal(journaled):
+    with open(journaled, "rb") as f:
+        snapshot = f.read()
+
+    add_and_save(journaled, 2, "second")
+    add_and_save(journaled, 2, "third")
+
+    with open(journaled, "rb") as f:
+        assert f.read() == snapshot
+    with open(daily_event_monitor.journal_path(journaled), "rb") as f:
+        assert len(f.read().splitlines()) == 2
+    assert values(journaled) == ["first", "second", "third"]
+
+
+def test_save_compacts_full_journal(journaled):
+    for day, value in enumerate(["second", "third", "fourth", "fifth"], 2):
+        add_and_save(journaled, day, value)
+
+    with open(daily_event_monitor.journal_path(journaled), "rb") as f:
+        assert f.read() == b""
+    assert values(journaled) == ["first", "second", "third", "fourth", "fifth"]
+
+
+def test_load_recovers_from_torn_journal_line(journaled):
+    add_and_save(journaled, 2, "second")
+    with open(daily_event_monitor.journal_path(journaled), "ab") as f:
+        f.write(b'{"date":"2030-1-3","t":"x"')
+
+    add_and_save(journaled, 4, "fourth")
+
+    # the torn record is dropped, and the next save rewrites the data file
+    # instead of appending after it
+    assert values(journaled) == ["first", "second", "fourth"]
+    with open(daily_event_monitor.journal_path(journaled), "rb") as f:
+        assert f.read() == b""
+
+
+def test_load_skips_journal_already_compacted(journaled, monkeypatch):
+    journal_filename = daily_event_monitor.journal_path(journaled)
+    add_and_save(journaled, 2, "second")
+    with open(journal_filename, "rb") as f:
+        journal = f.read()
+
+    # compact, then restore the journal as if interrupted before truncating it
+    monkeypatch.setattr(daily_event_monitor, "JOURNAL_MIN_DAYS", 1000)
+    daily_event_monitor.DailyEventMonitor(journaled).save()
+    monkeypatch.setattr(daily_event_monitor, "JOURNAL_MIN_DAYS", 0)
+    with open(journal_filename, "wb") as f:
+        f.write(journal)
+
+    assert values(journaled) == ["first", "second"]
+    add_and_save(journaled, 3, "third")
+    assert values(journaled) == ["first", "second", "third"]
+
+
+def test_save_with_pretty_writes_snapshot(journaled):
+    add_and_save(journaled, 2, "second")
+
+    dem = daily_event_monitor.DailyEventMonitor(journaled)
+    dem.save(pretty=True)
+
+    with open(journaled, "rb") as f:
+        assert f.read().startswith(b"{\n")
+    with open(daily_event_monitor.journal_path(journaled), "rb") as f:
+        assert f.read() == b""
+
+
+def test_load_migrates_legacy_layout(tmp_path):
+    filename = str(tmp_path / "headlines.json")
+    with open(filename, "w") as f:
+        json.dump({"2024-1-1": [["2024-01-01 09:00AM", "Penn wins"]]}, f)
+
+    dem = daily_event_monitor.DailyEventMonitor(filename)
+    assert dem.get(2024, 1, 1) == [("2024-01-01 09:00AM", "Penn wins")]
+    assert not dem.add(2024, 1, 1, "Penn wins")
+    dem.save()
+
+    with open(filename) as f:
+        assert json.load(f) == {
+            "2024-1-1": {"t": ["2024-01-01 09:00AM"], "v": ["Penn wins"]}
+        }
+
+
+def test_deepcopy_is_independent(tmp_path):
+    filename = str(tmp_path / "headlines.json")
+    dem = daily_event_monitor.DailyEventMonitor(filename)
+    dem.add(2024, 1, 1, "first")
+    dem.save()
+    dem.add(2024, 1, 1, "second")
+
+    dem_copy = copy.deepcopy(dem)
+    assert dem_copy.__dict__.keys() == dem.__dict__.keys()
+    assert dem_copy.data == dem.data
+    assert dem_copy._pending == dem._pending
+    assert dem_copy._synced_filename == dem._synced_filename == filename
+
+    dem_copy.add(2024, 1, 1, "third")
+    dem_copy.add(2024, 1, 2, "other")
+    assert [value for (_, value) in dem.get(2024, 1, 1)] == ["first", "second"]
+    assert "2024-1-2" not in dem.data
+    assert len(dem._pending) == 1
+
+
+def test_load_survives_unreadable_journal(journaled):
+    add_and_save(journaled, 2, "second")
+    journal_filename = daily_event_monitor.journal_path(journaled)
+    os.remove(journal_filename)
+    os.mkdir(journal_filename)
+
+    dem = daily_event_monitor.DailyEventMonitor()
+    assert dem.load(journaled)
+    assert dem.add(2030, 1, 3, "third")
+    dem.save()
+
+    # the journal could not be used, so the save wrote a full snapshot
+    with open(journaled, "rb") as f:
+        assert b"third" in f.read()
+
+
+def test_get_does_not_create_days(journaled):
+    dem = daily_event_monitor.DailyEventMonitor(journaled)
+    assert dem.get(2030, 1, 2) == []
+    dem.save(pretty=True)
+
+    assert "2030-1-2" not in daily_event_monitor.DailyEventMonitor(journaled).data
+
+
+def test_readme_journal_merge(journaled):
+    for day, value in enumerate(["second", "third"], 2):
+        add_and_save(journaled, day, value)
+    with open(daily_event_monitor.journal_path(journaled), "ab") as f:
+        f.write(b'{"date":"2030-1-1","t":"x","v":"first","n":1}\n{"date"')
+
+    # the merge procedure documented in the README
+    with open(journaled) as f:
+        data = json.load(f)
+    held = sum(len(events["v"]) for events in data.values())
+    with open(daily_event_monitor.journal_path(journaled)) as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if record["n"] <= held:
+                continue
+            events = data.setdefault(record["date"], {"t": [], "v": []})
+            events["t"].append(record["t"])
+            events["v"].append(record["v"])
+            held += 1
+
+    assert data == daily_event_monitor.DailyEventMonitor(journaled).data
+
+
+def test_format_time_matches_strftime():
+    start = datetime.datetime(2024, 3, 1)
+    for minute in range(24 * 60):
+        now = start + datetime.timedelta(minutes=minute)
+        assert daily_event_monitor._format_time(now) == now.strftime("%Y-%m-%d %I:%M%p")
+
+
+@pytest.mark.parametrize(
+    "hour, minute, expected",
+    [
+        (0, 0, "2024-03-01 12:00AM"),
+        (0, 59, "2024-03-01 12:59AM"),
+        (11, 59, "2024-03-01 11:59AM"),
+        (12, 0, "2024-03-01 12:00PM"),
+        (12, 59, "2024-03-01 12:59PM"),
+        (23, 59, "2024-03-01 11:59PM"),
+    ],
+)
+def test_format_time_boundaries(hour, minute, expected):
+    now = datetime.datetime(2024, 3, 1, hour, minute)
+    assert daily_event_monitor._format_time(now) == expected
+
+
+def test_write_file_resumes_partial_writes(monkeypatch, tmp_path):
+    filename = str(tmp_path / "partial.bin")
+    payload = bytes(range(256)) * 64
+    write = os.write
+    calls = []
+
+    def write_a_few_bytes(fd, data):
+        calls.append(len(data))
+        return write(fd, bytes(data[:7]))
+
+    monkeypatch.setattr(daily_event_monitor.os, "write", write_a_few_bytes)
+    daily_event_monitor._write_file(filename, payload)
+
+    with open(filename, "rb") as f:
+        assert f.read() == payload
+    assert len(calls) == -(-len(payload) // 7)
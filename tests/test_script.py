@@ -0,0 +1,54 @@
+import bs4
+import pytest
+
+import script
+
+
+def parse_headline(content):
+    target_element = bs4.BeautifulSoup(content, "lxml").find(
+        "a", class_="frontpage-link"
+    )
+    return "" if target_element is None else target_element.text
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        b'<div><a href="/x" class="big frontpage-link">Penn &amp; Co</a></div>',
+        b"<a class='frontpage-link'>Single quotes</a>",
+        b"<A CLASS=frontpage-link href=/x>Unquoted</A >",
+        b'<a class="frontpage-link"></a>',
+        b'<a class="frontpage-link"><span>First</span> story</a>'
+        b'<a class="frontpage-link">Second</a>',
+        b'<a data-class="frontpage-link">Wrong</a>'
+        b'<a class="frontpage-link">Right</a>',
+        b'<a class="frontpage-links">Wrong</a><a class="FRONTPAGE-LINK">Wrong</a>',
+        b'<a class="frontpage-link">Caf\xc3\xa9</a>',
+        b"<p>No headline</p>",
+        b'<a class="frontpage-link" title="a>b">Gt</a>',
+        b'<!-- <a class="frontpage-link">Old</a> --><a class="frontpage-link">New</a>',
+        b"<script>s = '<a class=\"frontpage-link\">Old</a>';</script>"
+        b'<a class="frontpage-link">New</a>',
+        b"<a title='x class=\"frontpage-link\"'>T</a>",
+        b'<a class="frontpage-link" class="other">dup</a>',
+        b'<a class="other" class="frontpage-link">Last class</a>',
+        b'<a class="frontpage-link"/>After',
+        b"<head><script>var x = 1;</script><style>a > b {}</style></head>"
+        b'<!-- note --><a class="frontpage-link">After script</a>',
+    ],
+)
+def test_extract_headline_matches_parser(content):
+    assert script.extract_headline(content) == parse_headline(content)
+
+
+def test_extract_headline_skips_parser_for_plain_anchor(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("parser should not be needed")
+
+    monkeypatch.setattr(script.bs4, "BeautifulSoup", fail)
+    content = (
+        b"<head><script>var x = '<b>';</script></head><!-- note -->"
+        b'<a href="/x" title="a > b" class="frontpage-link">Penn &amp; Co</a>'
+    )
+
+    assert script.extract_headline(content) == "Penn & Co"